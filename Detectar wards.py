@@ -1,21 +1,55 @@
 import cv2
 import numpy as np
 import tkinter as tk
-from datetime import datetime, timedelta
 import pygetwindow as gw
 import mss # Usar mss para captura de tela mais rápida
 import mss.tools
 import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, Tuple
 
 # --- Constantes de Configuração ---
 TESSERACT_PATH = r'C:\Program Files\Tesseract-OCR\tesseract.exe' # Mantido caso queira usar OCR no futuro
+# Para usar a GPU, o OpenCV precisa ter sido compilado com CUDA/cuDNN:
+#   cmake -DWITH_CUDA=ON -DWITH_CUDNN=ON -DOPENCV_DNN_CUDA=ON ...
+# Os pacotes pip "opencv-python" NÃO incluem CUDA; sem isso o script cai no CPU.
+OPENCV_CUDA_BUILD_FLAGS = "WITH_CUDA=ON WITH_CUDNN=ON OPENCV_DNN_CUDA=ON"
 WEIGHTS_PATH = r"C:\Users\wesle\Desktop\Bot\yolov3.weights"
 CFG_PATH = r"C:\Users\wesle\Desktop\Bot\yolov3.cfg"
 NAMES_PATH = r"C:\Users\wesle\Desktop\Bot\classes.names"
+# Modelo tiny treinado só para as 3 classes de item: ~10x menos FLOPs que o
+# YOLOv3 completo de 80 classes. Para gerar: cfg do yolov3-tiny com
+# classes=3 e filters=(3+5)*3=24 nas convoluções antes das camadas [yolo],
+# continuando o treino de yolov3-tiny.conv.15 com screenshots rotulados.
+TINY_WEIGHTS_PATH = r"C:\Users\wesle\Desktop\Bot\yolov3-tiny-wards.weights"
+TINY_CFG_PATH = r"C:\Users\wesle\Desktop\Bot\yolov3-tiny-wards.cfg"
+ONNX_PATH = r"C:\Users\wesle\Desktop\Bot\yolov3.onnx" # Exportado do .weights/.cfg (ex.: darknet2onnx)
+TRT_ENGINE_DIR = r"C:\Users\wesle\Desktop\Bot" # Engines .plan serializadas ficam aqui
+# Blobs .npy (3,416,416) pré-processados de screenshots do Dota para a
+# calibração INT8 do TensorRT; sem esta pasta a engine fica em FP16
+TRT_CALIB_DIR = r"C:\Users\wesle\Desktop\Bot\calibracao"
+TRT_CALIB_BATCH = 16
 DOTA_WINDOW_TITLE = "Dota 2"
 CONFIDENCE_THRESHOLD = 0.5  # Limiar de confiança para detecção YOLO
+NMS_IOU_THRESHOLD = 0.45  # Limiar de IoU para a supressão de não-máximos
+PREBLOB_MAX_WIDTH = 832  # Reduzir frames maiores que isso antes de montar o blob
+# Um ward novo cobre <0,2% da janela e mal mexe na média global da miniatura;
+# a comparação é por bloco: a miniatura 64x64 é dividida numa grade 8x8 e
+# basta UM bloco com diferença média acima do limiar para o frame contar como
+# alterado. Capturas de tela não têm ruído, então o limiar pode ser baixo.
+FRAME_DIFF_THRESHOLD = 2.0  # Diferença média por bloco (0-255) acima da qual o frame mudou
+FRAME_DIFF_SIZE = (64, 64)  # Miniatura usada na comparação entre frames
+FRAME_DIFF_BLOCKS = (8, 8)  # Grade de blocos sobre a miniatura
 DETECTION_INTERVAL_MS = 1500  # Intervalo entre detecções (em milissegundos)
+# Frames por forward (1 = desligado). O lote amortiza o custo fixo de
+# lançamento dos kernels, mas capturar os frames extras no mesmo instante só
+# enche o lote de quase-duplicatas que a dedup descarta — dobrando o custo da
+# inferência à toa e pondo uma captura bloqueante de volta no caminho crítico.
+# Só aumente se alimentar o lote com frames realmente distintos no tempo.
+BATCH_SIZE = 1
 OVERLAY_UPDATE_INTERVAL_MS = 500 # Intervalo de atualização do overlay
 DUPLICATE_THRESHOLD_SECONDS = 2.0 # Tempo para considerar detecções como duplicadas
 
@@ -27,6 +61,12 @@ ITEM_DURATIONS = {
 }
 # ---------------------------------
 
+# Preferir o modelo tiny específico de wards quando os arquivos existirem
+if os.path.exists(TINY_WEIGHTS_PATH) and os.path.exists(TINY_CFG_PATH):
+    WEIGHTS_PATH = TINY_WEIGHTS_PATH
+    CFG_PATH = TINY_CFG_PATH
+    print("Usando modelo YOLOv3-tiny treinado para wards.")
+
 # Verificar se os arquivos YOLO existem
 for path in [WEIGHTS_PATH, CFG_PATH, NAMES_PATH]:
     if not os.path.exists(path):
@@ -44,9 +84,34 @@ except Exception as e:
 # Carregar o modelo YOLO
 try:
     net = cv2.dnn.readNet(WEIGHTS_PATH, CFG_PATH)
-    # Configurar backend e target (opcional, pode melhorar performance em algumas GPUs)
-    # net.setPreferableBackend(cv2.dnn.DNN_BACKEND_CUDA)
-    # net.setPreferableTarget(cv2.dnn.DNN_TARGET_CUDA)
+    # Usar backend CUDA quando disponível: o forward do YOLO é o gargalo do
+    # detectar_itens e roda uma ordem de grandeza mais rápido na GPU.
+    try:
+        if hasattr(cv2, 'cuda') and cv2.cuda.getCudaEnabledDeviceCount() > 0:
+            net.setPreferableBackend(cv2.dnn.DNN_BACKEND_CUDA)
+            try:
+                # FP16 dobra o throughput em GPUs com Tensor Cores
+                net.setPreferableTarget(cv2.dnn.DNN_TARGET_CUDA_FP16)
+                print("Backend CUDA (FP16) habilitado para a detecção.")
+            except cv2.error:
+                net.setPreferableTarget(cv2.dnn.DNN_TARGET_CUDA)
+                print("Backend CUDA (FP32) habilitado para a detecção.")
+        else:
+            # Sem GPU NVIDIA: tentar o backend OpenVINO (Inference Engine),
+            # que acelera em CPUs Intel (AVX-512/VNNI) e na iGPU via OpenCL.
+            # Requer OpenCV compilado com suporte ao Inference Engine.
+            try:
+                net.setPreferableBackend(cv2.dnn.DNN_BACKEND_INFERENCE_ENGINE)
+                try:
+                    net.setPreferableTarget(cv2.dnn.DNN_TARGET_OPENCL_FP16)
+                    print("Backend OpenVINO (OpenCL FP16) habilitado para a detecção.")
+                except cv2.error:
+                    net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+                    print("Backend OpenVINO (CPU) habilitado para a detecção.")
+            except cv2.error:
+                print("CUDA e OpenVINO indisponíveis; detecção rodará na CPU.")
+    except (cv2.error, AttributeError) as e:
+        print(f"Aviso: não foi possível habilitar backend acelerado ({e}); usando CPU.")
 except cv2.error as e:
     print(f"Erro ao carregar o modelo YOLO: {e}")
     print("Verifique se os arquivos .weights e .cfg estão corretos e compatíveis.")
@@ -66,12 +131,355 @@ except IndexError as e:
     exit(1)
 
 
-# Lista para armazenar informações dos itens rastreados
-# Cada item será um dicionário: {'id': unique_id, 'name': str, 'expiry': datetime, 'region': str, 'added_time': datetime}
-tracked_items: List[Dict[str, Any]] = []
+# --- TensorRT (opcional) ---
+# Se tensorrt/pycuda estiverem instalados e existir um yolov3.onnx (ou uma
+# engine .plan já construída), a inferência usa TensorRT com FP16 — fusão de
+# camadas e Tensor Cores cortam a latência do forward em 2-4x frente ao DNN.
+# O ONNX deve incluir as camadas de decodificação do YOLO, de modo que cada
+# saída tenha o mesmo layout (linhas, 5 + num_classes) do cv2.dnn.
+USE_TRT = False
+try:
+    import tensorrt as trt
+    import pycuda.driver as cuda
+    import pycuda.autoinit  # noqa: F401 - inicializa o contexto CUDA
+    USE_TRT = True
+except ImportError:
+    trt = None
+    cuda = None
+
+
+if trt is not None:
+    class CalibradorEntropiaInt8(trt.IInt8EntropyCalibrator2):
+        """Alimenta o builder com blobs pré-processados para calibração INT8.
+
+        Lê blobs .npy (3,416,416) de screenshots do Dota em lotes e mantém a
+        tabela de calibração em cache no disco, de modo que builds seguintes
+        pulam a calibração inteira.
+        """
+
+        def __init__(self, calib_dir: str, batch_size: int = TRT_CALIB_BATCH):
+            super().__init__()
+            self.batch_size = batch_size
+            self.arquivos = sorted(
+                os.path.join(calib_dir, f) for f in os.listdir(calib_dir)
+                if f.endswith(".npy"))
+            self.indice = 0
+            self.cache_path = os.path.join(calib_dir, "calibracao_int8.cache")
+            self._dev_input = cuda.mem_alloc(batch_size * 3 * 416 * 416 * 4)
+
+        def get_batch_size(self) -> int:
+            return self.batch_size
+
+        def get_batch(self, names):
+            if self.indice + self.batch_size > len(self.arquivos):
+                return None # Fim do conjunto de calibração
+            lote = np.stack([
+                np.load(f) for f in
+                self.arquivos[self.indice:self.indice + self.batch_size]
+            ]).astype(np.float32)
+            self.indice += self.batch_size
+            cuda.memcpy_htod(self._dev_input, np.ascontiguousarray(lote))
+            return [int(self._dev_input)]
+
+        def read_calibration_cache(self):
+            if os.path.exists(self.cache_path):
+                with open(self.cache_path, "rb") as f:
+                    return f.read()
+            return None
+
+        def write_calibration_cache(self, cache):
+            with open(self.cache_path, "wb") as f:
+                f.write(cache)
+
+
+def construir_engine_trt(onnx_path: str) -> "trt.ICudaEngine":
+    """Constrói (ou carrega do cache em disco) uma engine TensorRT.
+
+    Usa INT8 com calibração por entropia quando a GPU suporta e existe um
+    conjunto de calibração em TRT_CALIB_DIR; caso contrário fica em FP16.
+    """
+    trt_logger = trt.Logger(trt.Logger.WARNING)
+
+    builder = trt.Builder(trt_logger)
+    tem_calibracao = (os.path.isdir(TRT_CALIB_DIR) and
+                      any(f.endswith(".npy") for f in os.listdir(TRT_CALIB_DIR)))
+    usar_int8 = builder.platform_has_fast_int8 and tem_calibracao
+    precisao = "int8" if usar_int8 else "fp16"
+
+    # Cache da engine serializada por GPU: uma .plan não é portável entre
+    # GPUs/drivers diferentes, então o nome do dispositivo entra no arquivo.
+    gpu_tag = cuda.Device(0).name().replace(" ", "_")
+    plan_path = os.path.join(TRT_ENGINE_DIR, f"yolov3_{precisao}_{gpu_tag}.plan")
+
+    runtime = trt.Runtime(trt_logger)
+    if os.path.exists(plan_path):
+        with open(plan_path, "rb") as f:
+            return runtime.deserialize_cuda_engine(f.read())
+
+    network = builder.create_network(
+        1 << int(trt.NetworkDefinitionCreationFlag.EXPLICIT_BATCH))
+    parser = trt.OnnxParser(network, trt_logger)
+    with open(onnx_path, "rb") as f:
+        if not parser.parse(f.read()):
+            raise RuntimeError(f"Falha ao parsear ONNX: {parser.get_error(0)}")
+
+    config = builder.create_builder_config()
+    if builder.platform_has_fast_fp16:
+        config.set_flag(trt.BuilderFlag.FP16)
+    if usar_int8:
+        # INT8 dobra o throughput sobre FP16 nas GPUs com DP4A/Tensor Cores;
+        # o FP16 acima continua marcado como fallback por camada
+        config.set_flag(trt.BuilderFlag.INT8)
+        config.int8_calibrator = CalibradorEntropiaInt8(TRT_CALIB_DIR)
+        print(f"Calibrando engine INT8 com o conjunto em {TRT_CALIB_DIR}...")
+    serialized = builder.build_serialized_network(network, config)
+    with open(plan_path, "wb") as f:
+        f.write(serialized)
+    print(f"Engine TensorRT construída e salva em {plan_path}")
+    return runtime.deserialize_cuda_engine(serialized)
+
+
+# Inicialização única: engine, contexto de execução e buffers (host fixado
+# em memória + device) alocados uma vez para evitar alocação por frame.
+_trt_context = None
+_trt_stream = None
+_trt_host_bufs = []   # (host pinned, device) por binding, na ordem da engine
+_trt_input_idx = 0
+
+if USE_TRT:
+    try:
+        if not os.path.exists(ONNX_PATH):
+            raise FileNotFoundError(ONNX_PATH)
+        _trt_engine = construir_engine_trt(ONNX_PATH)
+        _trt_context = _trt_engine.create_execution_context()
+        _trt_stream = cuda.Stream()
+        for i in range(_trt_engine.num_bindings):
+            shape = _trt_engine.get_binding_shape(i)
+            dtype = trt.nptype(_trt_engine.get_binding_dtype(i))
+            host_buf = cuda.pagelocked_empty(int(np.prod(shape)), dtype)
+            dev_buf = cuda.mem_alloc(host_buf.nbytes)
+            _trt_host_bufs.append((host_buf, dev_buf, tuple(shape)))
+            if _trt_engine.binding_is_input(i):
+                _trt_input_idx = i
+        print("Inferência via TensorRT FP16 habilitada.")
+    except Exception as e:
+        print(f"Aviso: TensorRT indisponível ({e}); usando OpenCV-DNN.")
+        USE_TRT = False
+
+
+def inferencia_trt(blob: np.ndarray) -> List[np.ndarray]:
+    """Executa o forward na engine TensorRT e retorna as saídas no host."""
+    host_in, dev_in, _ = _trt_host_bufs[_trt_input_idx]
+    np.copyto(host_in, blob.ravel())
+    cuda.memcpy_htod_async(dev_in, host_in, _trt_stream)
+    _trt_context.execute_async_v2(
+        bindings=[int(d) for _, d, _ in _trt_host_bufs],
+        stream_handle=_trt_stream.handle)
+    outputs = []
+    for i, (host_buf, dev_buf, shape) in enumerate(_trt_host_bufs):
+        if i == _trt_input_idx:
+            continue
+        cuda.memcpy_dtoh_async(host_buf, dev_buf, _trt_stream)
+        outputs.append((host_buf, shape))
+    _trt_stream.synchronize()
+    # Remodelar para (linhas, 5 + num_classes), mesmo layout do cv2.dnn
+    return [buf.reshape(shape).reshape(-1, 5 + len(CLASSES))
+            for buf, shape in outputs]
+
+
+# --- Pré-processamento na GPU (opcional) ---
+# O blobFromImage faz resize + escala + troca de canais na CPU e aloca um
+# tensor float32 novo a cada chamada. Com OpenCV compilado com CUDA, o
+# resize roda na GPU e o blob sai direto de lá, poupando banda da CPU.
+USE_CUDA_PREPROC = False
+try:
+    if (not USE_TRT and hasattr(cv2, 'cuda') and
+            cv2.cuda.getCudaEnabledDeviceCount() > 0 and
+            hasattr(cv2.dnn, 'blobFromGpuMat')):
+        # GpuMats persistentes: alocar memória de GPU por frame é caro
+        _gpu_src = cv2.cuda_GpuMat()
+        _gpu_dst = cv2.cuda_GpuMat(416, 416, cv2.CV_8UC3)
+        USE_CUDA_PREPROC = True
+        print("Pré-processamento (resize/blob) na GPU habilitado.")
+except (cv2.error, AttributeError):
+    USE_CUDA_PREPROC = False
+
+
+# Buffers de blob pré-alocados: o blobFromImage aloca um tensor float32 de
+# ~0,8 MB a cada chamada (e o binding Python não expõe o parâmetro dst).
+# Montar o blob à mão com resize(dst=...) + divide(out=...) zera as
+# alocações por frame no caminho de imagem única.
+_RESIZE_BUF = np.empty((416, 416, 3), np.uint8)
+_BLOB = np.empty((1, 3, 416, 416), np.float32)
+
+
+def montar_blob(frame: np.ndarray) -> np.ndarray:
+    """Equivale a blobFromImage(frame, 1/255, (416,416), swapRB=True, crop=False)
+    mas reutiliza os buffers de saída em vez de alocar a cada frame."""
+    cv2.resize(frame, (416, 416), dst=_RESIZE_BUF, interpolation=cv2.INTER_LINEAR)
+    # swapRB via inversão do eixo de canais (view); o divide escreve o
+    # resultado normalizado direto no blob NCHW pré-alocado
+    rgb = _RESIZE_BUF[..., ::-1]
+    np.divide(rgb.transpose(2, 0, 1), 255.0, out=_BLOB[0])
+    return _BLOB
+
+
+def blob_na_gpu(frame: np.ndarray) -> Any:
+    """Redimensiona o frame e monta o blob inteiramente na GPU."""
+    # O upload para GpuMat exige memória contígua; a view BGR fatiada da
+    # captura não é, então este é o único ponto que ainda materializa a cópia
+    _gpu_src.upload(np.ascontiguousarray(frame))
+    cv2.cuda.resize(_gpu_src, (416, 416), _gpu_dst, interpolation=cv2.INTER_LINEAR)
+    return cv2.dnn.blobFromGpuMat(_gpu_dst, 1/255.0, (416, 416), swapRB=True, crop=False)
+
+
+# --- Decodificação JIT com Numba (opcional) ---
+# Com o numba instalado, o threshold + NMS roda como um único loop nativo
+# compilado pelo LLVM, eliminando o overhead residual do interpretador em
+# volta das chamadas NumPy. Sem numba, o caminho vetorizado continua valendo.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _decode_nms_kernel(all_det: np.ndarray, conf_thr: float, iou_thr: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Threshold de confiança + NMS greedy num único loop estilo C.
+
+    Recebe as linhas brutas do YOLO (cx, cy, w, h, obj, classes...) e
+    retorna (índices mantidos em all_det, classe de cada um).
+    """
+    n = all_det.shape[0]
+    nc = all_det.shape[1] - 5
+
+    # Passada 1: argmax de classe + threshold de confiança
+    idxs = np.empty(n, np.int64)
+    cls = np.empty(n, np.int64)
+    confs = np.empty(n, np.float64)
+    m = 0
+    for i in range(n):
+        best = 0
+        best_v = all_det[i, 5]
+        for c in range(1, nc):
+            v = all_det[i, 5 + c]
+            if v > best_v:
+                best_v = v
+                best = c
+        if best_v > conf_thr:
+            idxs[m] = i
+            cls[m] = best
+            confs[m] = best_v
+            m += 1
+
+    # Passada 2: NMS greedy por ordem decrescente de confiança
+    order = np.argsort(-confs[:m])
+    kept = np.empty(m, np.int64)
+    kept_cls = np.empty(m, np.int64)
+    k = 0
+    for oi in range(m):
+        i = idxs[order[oi]]
+        cx_i, cy_i, w_i, h_i = all_det[i, 0], all_det[i, 1], all_det[i, 2], all_det[i, 3]
+        area_i = w_i * h_i
+        suprimida = False
+        for kj in range(k):
+            j = kept[kj]
+            cx_j, cy_j, w_j, h_j = all_det[j, 0], all_det[j, 1], all_det[j, 2], all_det[j, 3]
+            ix = min(cx_i + w_i / 2, cx_j + w_j / 2) - max(cx_i - w_i / 2, cx_j - w_j / 2)
+            iy = min(cy_i + h_i / 2, cy_j + h_j / 2) - max(cy_i - h_i / 2, cy_j - h_j / 2)
+            if ix > 0 and iy > 0:
+                inter = ix * iy
+                iou = inter / (area_i + w_j * h_j - inter)
+                if iou > iou_thr:
+                    suprimida = True
+                    break
+        if not suprimida:
+            kept[k] = i
+            kept_cls[k] = cls[order[oi]]
+            k += 1
+
+    return kept[:k], kept_cls[:k]
+
+
+if numba is not None:
+    _decode_nms_kernel = numba.njit(
+        cache=True, fastmath=True, boundscheck=False)(_decode_nms_kernel)
+    # Aquecer na carga do módulo: paga o custo de compilação (uma vez,
+    # graças ao cache=True) antes do mainloop do Tk começar
+    _decode_nms_kernel(np.zeros((1, 8), np.float32), 0.5, 0.45)
+
+
+# Itens rastreados em colunas paralelas (Structure-of-Arrays): os timestamps
+# ficam em arrays float64 contíguos, então o filtro de expiração do overlay
+# vira uma única comparação vetorizada em vez de um loop Python com datetime.
+@dataclass
+class ItensRastreados:
+    expiry_ts: np.ndarray = field(default_factory=lambda: np.empty(0, np.float64))
+    added_ts: np.ndarray = field(default_factory=lambda: np.empty(0, np.float64))
+    names: List[str] = field(default_factory=list)
+    regions: List[str] = field(default_factory=list)
+
+    def adicionar(self, name: str, region: str, added_ts: float, duration: float) -> None:
+        """Registra um item detectado com expiração em added_ts + duration."""
+        self.expiry_ts = np.append(self.expiry_ts, added_ts + duration)
+        self.added_ts = np.append(self.added_ts, added_ts)
+        self.names.append(name)
+        self.regions.append(region)
+
+    def remover_expirados(self, now_ts: float) -> None:
+        """Descarta itens cuja expiração já passou (comparação vetorizada)."""
+        mask = self.expiry_ts > now_ts
+        if not mask.all():
+            self.expiry_ts = self.expiry_ts[mask]
+            self.added_ts = self.added_ts[mask]
+            self.names = [n for n, manter in zip(self.names, mask) if manter]
+            self.regions = [r for r, manter in zip(self.regions, mask) if manter]
+
+
+tracked_items = ItensRastreados()
+
+# Índice de detecções recentes por (item, região): lookup O(1) para a
+# checagem de duplicatas, em vez de varrer tracked_items por detecção.
+# Timestamps como float (time.time()): subtração de float é ~10x mais
+# barata que aritmética de datetime.
+recent_by_key: Dict[Tuple[str, str], float] = {}
+
+
+def _formatar_hora(ts: float) -> str:
+    """Formata um timestamp epoch como HH:MM:SS (só na hora de imprimir)."""
+    return time.strftime('%H:%M:%S', time.localtime(ts))
+
+# --- Double-buffering da captura ---
+# Um worker único captura o frame do PRÓXIMO ciclo enquanto a thread
+# principal roda o forward da rede no frame atual, escondendo a latência
+# da captura atrás da inferência.
+_capture_executor = ThreadPoolExecutor(max_workers=1)
+_proxima_captura: Optional[Future] = None
+
+# Miniatura do último frame processado, para pular a inferência quando a
+# tela não mudou entre dois ciclos (redundância temporal)
+_thumb_anterior: Optional[np.ndarray] = None
+
+# Em vários builds do OpenCV um backend/target inválido (ex.: OpenCL sem
+# dispositivo OpenCL) só estoura no primeiro net.forward, não no set; este
+# flag garante que o fallback para CPU aconteça uma única vez.
+_backend_fallback_feito = False
 
 # --- Funções Auxiliares ---
 
+# Limiares de região pré-computados: o mapa vira uma busca binária
+# (np.digitize) numa grade 3x5 em vez de uma cadeia de if/elif em Python.
+# Ajuste as coordenadas e nomes das regiões conforme necessário.
+X_BINS = np.array([0.15, 0.33, 0.66, 0.85])
+Y_BINS = np.array([0.33, 0.66])
+REGION_TABLE = np.array([
+    ["Top Lane (Radiant)", "Top Lane (Radiant)", "Top Jungle (Radiant/Mid)",
+     "Top Lane/Jungle (Dire)", "Top Lane/Jungle (Dire)"],
+    ["Jungle (Radiant)", "Mid Lane (Radiant Side)", "Mid Lane (Centro)",
+     "Mid Lane (Dire Side)", "Jungle (Dire)"],
+    ["Bot Lane/Jungle (Radiant)", "Bot Lane/Jungle (Radiant)", "Bot Jungle (Dire/Mid)",
+     "Bot Lane (Dire)", "Bot Lane (Dire)"],
+])
+
 def obter_regiao_do_mapa(x: int, y: int, largura_tela: int, altura_tela: int) -> str:
     """
     Determina uma região aproximada do mapa com base nas coordenadas da tela.
@@ -81,146 +489,314 @@ def obter_regiao_do_mapa(x: int, y: int, largura_tela: int, altura_tela: int) ->
     if largura_tela == 0 or altura_tela == 0:
         return "Região Desconhecida"
 
-    nx, ny = x / largura_tela, y / altura_tela
-
-    # Ajuste as coordenadas e nomes das regiões conforme necessário
-    if ny < 0.33:
-        if nx < 0.33: return "Top Lane (Radiant)"
-        elif nx < 0.66: return "Top Jungle (Radiant/Mid)"
-        else: return "Top Lane/Jungle (Dire)"
-    elif ny < 0.66:
-        if nx < 0.15: return "Jungle (Radiant)"
-        elif nx < 0.33: return "Mid Lane (Radiant Side)"
-        elif nx < 0.66: return "Mid Lane (Centro)"
-        elif nx < 0.85: return "Mid Lane (Dire Side)"
-        else: return "Jungle (Dire)"
-    else:
-        if nx < 0.33: return "Bot Lane/Jungle (Radiant)"
-        elif nx < 0.66: return "Bot Jungle (Dire/Mid)"
-        else: return "Bot Lane (Dire)"
+    xi = np.digitize(x / largura_tela, X_BINS)
+    yi = np.digitize(y / altura_tela, Y_BINS)
+    return str(REGION_TABLE[yi, xi])
+
+# Instância MSS persistente por thread: reabrir a sessão DXGI/X11 a cada
+# captura custa dezenas de milissegundos de overhead fixo por frame, mas o
+# mss também não é thread-safe — e a captura roda tanto na thread principal
+# quanto no worker de pré-captura. threading.local dá uma instância a cada.
+_tls = threading.local()
+
+def _obter_sct() -> mss.mss:
+    """Retorna a instância mss persistente da thread atual."""
+    sct = getattr(_tls, "sct", None)
+    if sct is None:
+        sct = mss.mss()
+        _tls.sct = sct
+    return sct
+
+# Cache da geometria da janela do Dota: enumerar janelas via pygetwindow a
+# cada frame é caro, então a consulta só é refeita de tempos em tempos.
+GEOMETRY_REFRESH_SECONDS = 5.0
+_monitor_cache: Optional[Dict[str, int]] = None
+_monitor_cache_time = 0.0
+
+# No Windows, falar direto com a user32 evita a enumeração de TODAS as
+# janelas de topo que o pygetwindow faz: FindWindowW resolve o handle uma
+# vez e GetWindowRect preenche a struct de geometria em O(1).
+if os.name == "nt":
+    import ctypes
+    from ctypes import wintypes
+    _user32 = ctypes.windll.user32
+_hwnd_cache = 0
+
+def _consultar_janela_win32(window_title: str) -> Optional[Dict[str, int]]:
+    """Obtém a geometria da janela via user32, reusando o HWND em cache."""
+    global _hwnd_cache
+
+    hwnd = _hwnd_cache
+    if not hwnd or not _user32.IsWindow(hwnd):
+        # Janela fechada/relançada: resolver o handle de novo
+        hwnd = _user32.FindWindowW(None, window_title)
+        _hwnd_cache = hwnd
+    if not hwnd or _user32.IsIconic(hwnd):
+        return None # Janela inexistente ou minimizada
+
+    rect = wintypes.RECT()
+    if not _user32.GetWindowRect(hwnd, ctypes.byref(rect)):
+        _hwnd_cache = 0
+        return None
 
-    return "Região Indefinida" # Fallback
+    largura = rect.right - rect.left
+    altura = rect.bottom - rect.top
+    if largura <= 0 or altura <= 0:
+        return None
+    return {"top": rect.top, "left": rect.left, "width": largura, "height": altura}
+
+def _obter_monitor(window_title: str) -> Optional[Dict[str, int]]:
+    """Retorna a região de captura da janela, usando o cache quando recente."""
+    global _monitor_cache, _monitor_cache_time
+
+    agora = time.monotonic()
+    if _monitor_cache is not None and (agora - _monitor_cache_time) < GEOMETRY_REFRESH_SECONDS:
+        return _monitor_cache
+
+    if os.name == "nt":
+        _monitor_cache = _consultar_janela_win32(window_title)
+        if _monitor_cache is not None:
+            _monitor_cache_time = agora
+        return _monitor_cache
+
+    dota_windows = gw.getWindowsWithTitle(window_title)
+    if not dota_windows:
+        # print(f"Janela '{window_title}' não encontrada.") # Comentado para não poluir console
+        _monitor_cache = None
+        return None
+    dota_window = dota_windows[0]
+
+    # Corrigir possíveis problemas com janelas minimizadas ou com tamanho zero
+    if not dota_window.isVisible or dota_window.isMinimized or dota_window.width <= 0 or dota_window.height <= 0:
+         # print(f"Janela '{window_title}' não está visível ou tem tamanho inválido.")
+         _monitor_cache = None
+         return None
+
+    # Definir a região de captura com base na janela encontrada
+    _monitor_cache = {
+        "top": dota_window.top,
+        "left": dota_window.left,
+        "width": dota_window.width,
+        "height": dota_window.height,
+    }
+    _monitor_cache_time = agora
+    return _monitor_cache
+
+def reduzir_frame(frame: np.ndarray) -> np.ndarray:
+    """Reduz o frame para no máximo PREBLOB_MAX_WIDTH de largura (INTER_AREA)."""
+    h, w = frame.shape[:2]
+    if w <= PREBLOB_MAX_WIDTH:
+        return frame
+    nova_altura = int(h * PREBLOB_MAX_WIDTH / w)
+    return cv2.resize(frame, (PREBLOB_MAX_WIDTH, nova_altura), interpolation=cv2.INTER_AREA)
 
 def captura_tela(window_title: str) -> Optional[Tuple[np.ndarray, int, int, int, int]]:
     """Captura a tela da janela especificada usando mss."""
+    global _monitor_cache
     try:
-        dota_windows = gw.getWindowsWithTitle(window_title)
-        if not dota_windows:
-            # print(f"Janela '{window_title}' não encontrada.") # Comentado para não poluir console
+        monitor = _obter_monitor(window_title)
+        if monitor is None:
             return None
-        dota_window = dota_windows[0]
-
-        # Corrigir possíveis problemas com janelas minimizadas ou com tamanho zero
-        if not dota_window.isVisible or dota_window.isMinimized or dota_window.width <= 0 or dota_window.height <= 0:
-             # print(f"Janela '{window_title}' não está visível ou tem tamanho inválido.")
-             return None
-
-        # Definir a região de captura com base na janela encontrada
-        monitor = {
-            "top": dota_window.top,
-            "left": dota_window.left,
-            "width": dota_window.width,
-            "height": dota_window.height,
-        }
-
-        with mss.mss() as sct:
-            sct_img = sct.grab(monitor)
-            # Converter para formato OpenCV (BGR)
-            img = np.array(sct_img)
-            img_bgr = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR) # Ou COLOR_RGB2BGR se BGRA não funcionar
-            return img_bgr, dota_window.left, dota_window.top, dota_window.width, dota_window.height
+
+        raw = _obter_sct().grab(monitor)
+        # Visão (view) direta sobre o buffer BGRA do MSS: sem np.array nem
+        # cvtColor, nenhuma cópia do frame inteiro — o byte alfa do MSS é
+        # sempre 255, então removê-lo com cvtColor era só banda desperdiçada.
+        # O fatiamento [..., :3] entrega BGR (o que o blobFromImage espera) e
+        # deixa a contiguidade por conta de quem consumir o array.
+        # NOTA: em alguns backends X11 o MSS entrega RGBA; se as cores das
+        # detecções saírem trocadas, ajuste o swapRB do blobFromImage.
+        img = np.frombuffer(raw.raw, dtype=np.uint8).reshape(raw.height, raw.width, 4)
+        img_bgr = img[..., :3]
+        return img_bgr, monitor["left"], monitor["top"], monitor["width"], monitor["height"]
 
     except Exception as e:
         print(f"Erro durante a captura de tela: {e}")
+        _monitor_cache = None # A janela pode ter mudado; forçar nova consulta
         return None
 
 # --- Funções Principais ---
 
 def detectar_itens():
     """Detecta itens na tela, calcula a região e adiciona à lista de rastreamento."""
-    global tracked_items
-    frame_data = captura_tela(DOTA_WINDOW_TITLE)
+    global _proxima_captura, USE_TRT
+
+    # Consumir o frame pré-capturado pelo worker (se houver) e já disparar
+    # a captura do próximo ciclo antes de começar a inferência.
+    if _proxima_captura is not None:
+        frame_data = _proxima_captura.result()
+    else:
+        frame_data = captura_tela(DOTA_WINDOW_TITLE)
+    _proxima_captura = _capture_executor.submit(captura_tela, DOTA_WINDOW_TITLE)
 
     if frame_data is None:
         return # Não fazer nada se a janela não for encontrada ou houver erro
 
     frame, win_x, win_y, win_w, win_h = frame_data
+    # Pré-reduzir frames grandes (ex.: 1440p) com INTER_AREA: o blobFromImage
+    # redimensionaria de qualquer forma para 416x416, mas tocando muito mais
+    # bytes; reduzir antes corta a banda de memória do resize final.
+    frame = reduzir_frame(frame)
     height, width, _ = frame.shape
 
-    # Criar blob para a rede neural
-    blob = cv2.dnn.blobFromImage(frame, 1/255.0, (416, 416), swapRB=True, crop=False)
-    net.setInput(blob)
+    # Entre dois ciclos (1,5 s) a tela frequentemente não mudou; comparar
+    # miniaturas 64x64 custa microssegundos e evita o forward inteiro.
+    # A decisão é pelo PIOR bloco da grade 8x8 (o INTER_AREA tira a média
+    # por bloco), não pela média global: um ward novo só mexe numa região
+    # minúscula e seria invisível na média da miniatura inteira.
+    global _thumb_anterior
+    thumb = cv2.resize(frame, FRAME_DIFF_SIZE, interpolation=cv2.INTER_AREA)
+    if _thumb_anterior is not None:
+        diff = cv2.absdiff(_thumb_anterior, thumb)
+        blocos = cv2.resize(diff, FRAME_DIFF_BLOCKS, interpolation=cv2.INTER_AREA)
+        if blocos.max() < FRAME_DIFF_THRESHOLD:
+            return # Nenhum bloco mudou o bastante; nada novo a detectar
+    _thumb_anterior = thumb
+
+    # Capturar frames extras para rodar em lote: um único forward com N
+    # imagens amortiza o overhead de lançamento de kernels entre elas.
+    # (O caminho TensorRT tem buffers de batch 1, então fica fora do lote.)
+    frames = [frame]
+    if BATCH_SIZE > 1 and not USE_TRT:
+        while len(frames) < BATCH_SIZE:
+            extra = captura_tela(DOTA_WINDOW_TITLE)
+            if extra is None:
+                break
+            frames.append(reduzir_frame(extra[0]))
 
-    try:
-        # Executar a detecção
-        outputs = net.forward(out_layers)
-    except cv2.error as e:
-        print(f"Erro durante o forward pass da rede: {e}")
-        return # Abortar detecção neste frame
+    # Criar blob para a rede neural
+    if len(frames) > 1:
+        blob = cv2.dnn.blobFromImages(frames, 1/255.0, (416, 416), swapRB=True, crop=False)
+    elif USE_CUDA_PREPROC:
+        try:
+            blob = blob_na_gpu(frame)
+        except cv2.error as e:
+            print(f"Erro no pré-processamento na GPU ({e}); usando CPU.")
+            blob = montar_blob(frame)
+    else:
+        blob = montar_blob(frame)
+
+    # Executar a detecção (TensorRT quando disponível, senão OpenCV-DNN)
+    if USE_TRT:
+        try:
+            outputs = inferencia_trt(blob)
+        except Exception as e:
+            # TensorRT/pycuda lançam seus próprios tipos de exceção (nunca
+            # cv2.error); se um forward falhar em runtime, desligar o TRT de
+            # vez e cair no DNN em vez de deixar o erro matar o loop agendado
+            print(f"Erro na inferência TensorRT ({e}); desativando TRT e usando OpenCV-DNN.")
+            USE_TRT = False
+    if not USE_TRT:
+        global _backend_fallback_feito
+        try:
+            net.setInput(blob)
+            outputs = net.forward(out_layers)
+        except cv2.error as e:
+            if _backend_fallback_feito:
+                print(f"Erro durante o forward pass da rede: {e}")
+                return # Abortar detecção neste frame
+            # O backend acelerado escolhido na carga pode só falhar aqui, no
+            # primeiro forward; voltar de vez para o backend padrão na CPU e
+            # repetir, em vez de falhar em silêncio a cada ciclo para sempre
+            _backend_fallback_feito = True
+            print(f"Erro no forward com o backend acelerado ({e}); revertendo para CPU.")
+            try:
+                net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
+                net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+                net.setInput(blob)
+                outputs = net.forward(out_layers)
+            except cv2.error as e2:
+                print(f"Erro durante o forward pass da rede: {e2}")
+                return # Abortar detecção neste frame
 
     detections = []
-    current_time = datetime.now()
-
-    # Processar as saídas da rede
-    for output in outputs:
-        for detection in output:
-            scores = detection[5:]
-            class_id = np.argmax(scores)
-            confidence = scores[class_id]
+    now_ts = time.time()
+
+    # Processar as saídas da rede de forma vetorizada: argmax e threshold
+    # rodam nos kernels C do NumPy sobre todas as ~10k linhas de uma vez,
+    # em vez de um loop Python por candidato.
+    # Achatar a dimensão de batch junto com as linhas: as detecções de todos
+    # os frames do lote entram juntas e a varredura de duplicatas remove as
+    # repetições entre frames quase idênticos do mesmo ciclo.
+    all_det = np.concatenate(
+        [np.asarray(o).reshape(-1, np.asarray(o).shape[-1]) for o in outputs],
+        axis=0)
+    if numba is not None:
+        # Caminho JIT: threshold + NMS num único kernel nativo compilado
+        kept_idx, kept_ids = _decode_nms_kernel(
+            np.ascontiguousarray(all_det, dtype=np.float32),
+            CONFIDENCE_THRESHOLD, NMS_IOU_THRESHOLD)
+        kept_det = all_det[kept_idx]
+        nms_idxs = np.arange(len(kept_idx))
+    else:
+        scores = all_det[:, 5:]
+        class_ids = scores.argmax(axis=1)
+        confidences = scores[np.arange(len(scores)), class_ids]
+        keep = confidences > CONFIDENCE_THRESHOLD
+        kept_det = all_det[keep]
+        kept_ids = class_ids[keep]
+        kept_conf = confidences[keep]
+
+        # NMS class-agnóstico: o YOLO emite várias caixas sobrepostas por objeto;
+        # suprimi-las aqui reduz N de dezenas para unidades antes da lógica de
+        # região e da varredura de duplicatas (que é O(N x itens rastreados)).
+        if len(kept_det) > 0:
+            centros = kept_det[:, 0:2] * (width, height)
+            tamanhos = kept_det[:, 2:4] * (width, height)
+            boxes = np.hstack((centros - tamanhos / 2, tamanhos)).astype(int)
+            nms_idxs = cv2.dnn.NMSBoxes(
+                boxes.tolist(), kept_conf.astype(float).tolist(),
+                CONFIDENCE_THRESHOLD, NMS_IOU_THRESHOLD)
+            nms_idxs = np.asarray(nms_idxs).ravel()
+        else:
+            nms_idxs = []
 
-            if confidence > CONFIDENCE_THRESHOLD and class_id < len(CLASSES):
-                item_name = CLASSES[class_id]
+    # Região do mapa de todos os sobreviventes de uma vez: as coordenadas do
+    # YOLO já vêm normalizadas (0-1), então é um digitize + indexação da tabela
+    if len(nms_idxs) > 0:
+        xi = np.digitize(kept_det[nms_idxs, 0], X_BINS)
+        yi = np.digitize(kept_det[nms_idxs, 1], Y_BINS)
+        regioes = REGION_TABLE[yi, xi]
 
-                if item_name in ITEM_DURATIONS:
-                    # Obter coordenadas do centro do item detectado na tela
-                    center_x = int(detection[0] * width)
-                    center_y = int(detection[1] * height)
-                    # w_box = int(detection[2] * width) # Largura da caixa (não usada aqui)
-                    # h_box = int(detection[3] * height) # Altura da caixa (não usada aqui)
+    # Iterar apenas os poucos candidatos que sobreviveram ao threshold + NMS
+    for pos, i in enumerate(nms_idxs):
+        class_id = kept_ids[i]
+        if class_id >= len(CLASSES):
+            continue
+        item_name = CLASSES[class_id]
 
-                    regiao = obter_regiao_do_mapa(center_x, center_y, width, height)
+        if item_name in ITEM_DURATIONS:
+            regiao = str(regioes[pos])
 
-                    # --- Verificação de Duplicatas ---
-                    is_duplicate = False
-                    for existing_item in tracked_items:
-                        time_diff = (current_time - existing_item['added_time']).total_seconds()
-                        if (existing_item['name'] == item_name and
-                            existing_item['region'] == regiao and # Verifica mesma região (pode ser flexibilizado)
-                            abs(time_diff) < DUPLICATE_THRESHOLD_SECONDS):
-                            is_duplicate = True
-                            break # Encontrou um item muito similar recentemente
+            # --- Verificação de Duplicatas ---
+            # Um item da mesma classe visto há pouco na mesma região é o
+            # mesmo objeto sendo re-detectado
+            ultima_detecao = recent_by_key.get((item_name, regiao))
+            if (ultima_detecao is not None and
+                now_ts - ultima_detecao < DUPLICATE_THRESHOLD_SECONDS):
+                continue # Encontrou um item muito similar recentemente
 
-                    if not is_duplicate:
-                        detections.append({'name': item_name, 'region': regiao, 'time': current_time})
+            recent_by_key[(item_name, regiao)] = now_ts
+            detections.append({'name': item_name, 'region': regiao, 'time': now_ts})
 
-                        # Desenhar um círculo onde o item foi detectado (apenas para debug visual)
-                        # cv2.circle(frame, (center_x, center_y), 10, (0, 255, 0), 2)
+            # Desenhar um círculo onde o item foi detectado (apenas para debug visual)
+            # cv2.circle(frame, (center_x, center_y), 10, (0, 255, 0), 2)
 
 
     # Adicionar novas detecções (não duplicadas) à lista de rastreamento
     for detected in detections:
         item_name = detected['name']
         regiao = detected['region']
-        detection_time = detected['time']
+        detection_ts = detected['time']
         duration = ITEM_DURATIONS[item_name]
 
         # Só adicionar itens que têm duração (wards)
         if duration > 0:
-            expiry_time = detection_time + timedelta(seconds=duration)
-            unique_id = f"{item_name}_{regiao}_{detection_time.timestamp()}" # ID simples
-
-            new_item_data = {
-                'id': unique_id,
-                'name': item_name,
-                'expiry': expiry_time,
-                'region': regiao,
-                'added_time': detection_time # Hora que foi detectado pela primeira vez
-            }
-            tracked_items.append(new_item_data)
-            print(f"[{detection_time.strftime('%H:%M:%S')}] {item_name} detectado em '{regiao}'. Expira às {expiry_time.strftime('%H:%M:%S')}.")
+            tracked_items.adicionar(item_name, regiao, detection_ts, duration)
+            print(f"[{_formatar_hora(detection_ts)}] {item_name} detectado em '{regiao}'. Expira às {_formatar_hora(detection_ts + duration)}.")
         else:
              # Para itens sem duração como Smoke, apenas registrar o evento se desejar
-             print(f"[{detection_time.strftime('%H:%M:%S')}] {item_name} detectado em '{regiao}'.")
+             print(f"[{_formatar_hora(detection_ts)}] {item_name} detectado em '{regiao}'.")
 
     # Exibir frame com detecções (opcional, para debug)
     # cv2.imshow("Dota 2 Detection", frame)
@@ -241,6 +817,15 @@ root.attributes("-alpha", 0.75)       # Nível de transparência (0.0 a 1.0)
 root.overrideredirect(True)         # Remove a barra de título e bordas
 root.configure(bg="black")          # Cor de fundo inicial
 
+# Tornar o fundo preto transparente (uma vez só: a chamada é idempotente e
+# não precisa ser repetida a cada atualização do overlay)
+# ATENÇÃO: Isso pode não funcionar perfeitamente em todos os sistemas/compositors
+try:
+    root.attributes("-transparentcolor", "black")
+except tk.TclError:
+    print("Aviso: -transparentcolor pode não ser suportado neste sistema.")
+    root.configure(bg="#010101") # Usar um preto quase puro se transparente falhar
+
 # --- Frame principal para conteúdo e scrollbar ---
 main_frame = tk.Frame(root, bg="black")
 main_frame.pack(fill=tk.BOTH, expand=True)
@@ -287,44 +872,42 @@ info_text.bind("<B1-Motion>", do_move)
 
 
 # --- Função para Atualizar o Texto no Overlay ---
+# Último conteúdo renderizado: se nada mudou (comum com contagens em
+# segundos a cada 500 ms), o delete+insert do widget de texto é pulado
+_ultimo_texto_overlay: Optional[str] = None
+
 def atualizar_overlay():
     """Atualiza o widget de texto com os itens ativos e seus tempos restantes."""
-    global tracked_items
-    current_time = datetime.now()
-    active_messages = []
+    now_ts = time.time()
 
-    # Filtrar itens expirados e criar mensagens para os ativos
-    valid_items = []
-    for item in tracked_items:
-        remaining_seconds = (item['expiry'] - current_time).total_seconds()
-        if remaining_seconds > 0:
-            valid_items.append(item) # Manter item na lista
-            minutes, seconds = divmod(int(remaining_seconds), 60)
-            # Formato: NomeItem [Região]: MM:SS
-            message = f"{item['name']} [{item['region']}]: {minutes}:{seconds:02d}"
-            active_messages.append(message)
-        # else: item expirado, será removido implicitamente
-
-    tracked_items = valid_items # Atualizar a lista global removendo os expirados
-
-    # Limpar o conteúdo atual e inserir as novas mensagens
-    info_text.configure(state=tk.NORMAL) # Habilitar edição
-    info_text.delete(1.0, tk.END)
-    if active_messages:
-        info_text.insert(tk.END, "\n".join(active_messages))
-    else:
-        info_text.insert(tk.END, "Nenhum item rastreado.")
-    info_text.configure(state=tk.DISABLED) # Desabilitar edição pelo usuário
-
-    # Tornar o fundo preto transparente
-    # ATENÇÃO: Isso pode não funcionar perfeitamente em todos os sistemas/compositors
-    # Pode ser necessário ajustar a cor ou a abordagem dependendo do seu ambiente.
-    try:
-        root.attributes("-transparentcolor", "black")
-    except tk.TclError:
-         print("Aviso: -transparentcolor pode não ser suportado neste sistema.")
-         root.configure(bg="#010101") # Usar um preto quase puro se transparente falhar
+    # Remover expirados (máscara vetorizada) e calcular os tempos restantes
+    # de todos os itens de uma vez, em vez de datetime por item
+    tracked_items.remover_expirados(now_ts)
+    remaining = tracked_items.expiry_ts - now_ts
 
+    active_messages = []
+    for nome, regiao, restante in zip(tracked_items.names, tracked_items.regions, remaining):
+        minutes, seconds = divmod(int(restante), 60)
+        # Formato: NomeItem [Região]: MM:SS
+        active_messages.append(f"{nome} [{regiao}]: {minutes}:{seconds:02d}")
+
+    # Purgar do índice de duplicatas as entradas que já saíram da janela
+    # de deduplicação, para o dicionário não crescer indefinidamente
+    expiradas = [chave for chave, detectado_em in recent_by_key.items()
+                 if now_ts - detectado_em > DUPLICATE_THRESHOLD_SECONDS]
+    for chave in expiradas:
+        del recent_by_key[chave]
+
+    # Reinserir o texto só quando o conteúdo realmente mudou: o delete +
+    # insert reflui o widget inteiro e custa alguns ms por atualização
+    global _ultimo_texto_overlay
+    novo_texto = "\n".join(active_messages) if active_messages else "Nenhum item rastreado."
+    if novo_texto != _ultimo_texto_overlay:
+        _ultimo_texto_overlay = novo_texto
+        info_text.configure(state=tk.NORMAL) # Habilitar edição
+        info_text.delete(1.0, tk.END)
+        info_text.insert(tk.END, novo_texto)
+        info_text.configure(state=tk.DISABLED) # Desabilitar edição pelo usuário
 
     # Agendar a próxima atualização
     root.after(OVERLAY_UPDATE_INTERVAL_MS, atualizar_overlay)